@@ -14,6 +14,7 @@ bl_info = {
 }
 
 import bpy
+from bpy.app.handlers import persistent
 
 # Import submodules
 from . import geometry
@@ -32,6 +33,12 @@ classes = (
 )
 
 
+@persistent
+def clear_keycap_cache(_dummy):
+    """Cached keycap meshes belong to the file that was just closed"""
+    geometry.KeycapGenerator.clear_mesh_cache()
+
+
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
@@ -41,9 +48,13 @@ def register():
     bpy.types.Scene.export_settings = bpy.props.PointerProperty(
         type=properties.KeycapExportProperties
     )
+    bpy.app.handlers.load_post.append(clear_keycap_cache)
 
 
 def unregister():
+    if bpy.app.timers.is_registered(properties.flush_pending_updates):
+        bpy.app.timers.unregister(properties.flush_pending_updates)
+    bpy.app.handlers.load_post.remove(clear_keycap_cache)
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.keycap_props
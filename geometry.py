@@ -3,26 +3,93 @@ Keycap geometry generation
 """
 
 import bpy
-import bmesh
-from mathutils import Vector
-from math import radians
-import math
+import functools
+import numpy as np
+from collections import OrderedDict
+
+# Per-profile dimensions (mm): how much narrower the top face is than the
+# base, how far the top face is pulled in at the front, and the keycap
+# height for rows R1-R4
+PROFILES = {
+    "CHERRY": {
+        "top_delta": 5.5,
+        "front_taper": 3.4,
+        "row_heights": (11.5, 9.5, 8.5, 9.5),
+    },
+    "OEM": {
+        "top_delta": 3.0,
+        "front_taper": 3.0,
+        "row_heights": (12.5, 11.0, 9.5, 10.5),
+    },
+    "SA": {
+        "top_delta": 2.5,
+        "front_taper": 2.5,
+        "row_heights": (14.89, 13.49, 12.925, 13.49),
+    },
+}
+
+# Corner order shared by every rectangular ring of the shell:
+# back left, back right, front right, front left
+CORNER_X_SIGNS = np.array((-1.0, 1.0, 1.0, -1.0), dtype=np.float32)
+CORNER_IS_FRONT = np.array((False, False, True, True))
+
+# Shell quads over the vertex layout base outer (0-3), top outer (4-7),
+# base inner (8-11), top inner (12-15)
+SHELL_FACES = (
+    # Top face (outer)
+    (4, 5, 6, 7),
+    # Outer side faces
+    (0, 1, 5, 4),
+    (1, 2, 6, 5),
+    (2, 3, 7, 6),
+    (3, 0, 4, 7),
+    # Inner side faces
+    (8, 12, 13, 9),
+    (9, 13, 14, 10),
+    (10, 14, 15, 11),
+    (11, 15, 12, 8),
+    # Bottom rim faces (where outer meets inner)
+    (0, 8, 9, 1),
+    (1, 9, 10, 2),
+    (2, 10, 11, 3),
+    (3, 11, 8, 0),
+)
+
+# Inner ceiling (top inner ring) - reversed to face inward. With a stem it
+# is replaced by n-gons around the stem top instead.
+CEILING_FACE = (15, 14, 13, 12)
+
+# Inner ceiling corners in counter-clockwise order, each paired with the
+# point on the stem outline (in eighths of a turn) that it is joined to
+CEILING_SPOKES = ((13, 7), (14, 1), (15, 3), (12, 5))
+
+# Shell vertex pairs that receive bevel weights: outer vertical corners
+# (base_outer[i] -> top_outer[i]) and the outer top rim
+CORNER_EDGES = ((0, 4), (1, 5), (2, 6), (3, 7))
+TOP_RIM_EDGES = ((4, 5), (5, 6), (6, 7), (7, 4))
+
+# Names of keycap meshes built this session, keyed by the parameters that
+# shape them. Blender reuses the name of a removed mesh, so each built mesh
+# is also stamped with its key and only counts as cached if the stamp matches.
+# Kept in least-recently-used order and trimmed to MESH_CACHE_SIZE.
+MESH_CACHE_SIZE = 32
+_MESH_CACHE = OrderedDict()
 
 
 class KeycapGenerator:
     """Generates keycap geometry with parametric controls"""
 
-    def add_bevel_modifiers(obj):
-        for name in ["Bevel_Vert_Mod", "Bevel_Dish_Mod"]:
-            if obj.modifiers.get(name):
-                continue  # don't recreate if already exists
+    @staticmethod
+    def add_bevel_modifiers(obj, bevel_vertical, bevel_segments=4):
+        if obj.modifiers.get("Bevel_Vert_Mod") is not None:
+            return  # don't recreate if already exists
 
         vert_mod = obj.modifiers.new("Bevel_Vert_Mod", "BEVEL")
         vert_mod.limit_method = "WEIGHT"
-        vert_mod.segments = 8
+        vert_mod.segments = bevel_segments
         vert_mod.use_clamp_overlap = True
         vert_mod.profile = 0.64
-        vert_mod.width = bpy.context.scene.keycap_props.bevel_vertical
+        vert_mod.width = bevel_vertical
 
     @staticmethod
     def create_keycap(
@@ -30,21 +97,158 @@ class KeycapGenerator:
         profile_type="CHERRY",
         profile_row=3,
         bevel_vertical=1.5,
+        bevel_segments=4,
         stem_type="CHERRY_MX",
+        stem_segments=32,
     ):
 
-        # Create new mesh and object
-        mesh = bpy.data.meshes.new("Keycap")
+        mesh = KeycapGenerator._get_mesh(
+            width, profile_type, profile_row, stem_type, stem_segments
+        )
         obj = bpy.data.objects.new("Keycap", mesh)
         bpy.context.collection.objects.link(obj)
 
-        # Create bmesh
-        bm = bmesh.new()
+        KeycapGenerator.add_bevel_modifiers(obj, bevel_vertical, bevel_segments)
+
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+
+        return obj
+
+    @staticmethod
+    def update_keycap(
+        obj,
+        width=1.0,
+        profile_type="CHERRY",
+        profile_row=3,
+        bevel_vertical=1.5,
+        bevel_segments=4,
+        stem_type="CHERRY_MX",
+        stem_segments=32,
+    ):
+        """Re-shape an existing keycap in place by swapping its mesh data"""
+        # A mesh only this keycap owns (e.g. after baking) is rebuilt in
+        # place on a cache miss, or dropped when a cached mesh takes over
+        old_mesh = obj.data
+        private = old_mesh.users == 1 and not KeycapGenerator._is_cached(old_mesh)
+        mesh = KeycapGenerator._get_mesh(
+            width,
+            profile_type,
+            profile_row,
+            stem_type,
+            stem_segments,
+            spare=old_mesh if private else None,
+        )
+        if mesh is not old_mesh:
+            obj.data = mesh
+            if private:
+                bpy.data.meshes.remove(old_mesh)
+        # A baked keycap has lost its live bevel
+        KeycapGenerator.add_bevel_modifiers(obj, bevel_vertical, bevel_segments)
+
+    @staticmethod
+    def _get_mesh(
+        width, profile_type, profile_row, stem_type, stem_segments, spare=None
+    ):
+        """Keycaps with identical parameters share one mesh datablock
+
+        On a cache miss the keycap is built into spare, if given, instead of
+        a newly allocated mesh.
+        """
+        key = repr((width, profile_type, profile_row, stem_type, stem_segments))
+        mesh = bpy.data.meshes.get(_MESH_CACHE.get(key, ""))
+        if mesh is None or mesh.get("_keycap_key") != key:
+            if spare is not None:
+                mesh = spare
+                mesh.clear_geometry()
+            else:
+                mesh = bpy.data.meshes.new("Keycap")
+            KeycapGenerator._build_mesh(
+                mesh, width, profile_type, profile_row, stem_type, stem_segments
+            )
+            mesh["_keycap_key"] = key
+            _MESH_CACHE[key] = mesh.name
+
+        _MESH_CACHE.move_to_end(key)
+        if len(_MESH_CACHE) > MESH_CACHE_SIZE:
+            stale_key, stale_name = _MESH_CACHE.popitem(last=False)
+            stale = bpy.data.meshes.get(stale_name)
+            # Only remove the evicted keycap, not a mesh that took its name
+            if (
+                stale is not None
+                and stale.users == 0
+                and stale.get("_keycap_key") == stale_key
+            ):
+                bpy.data.meshes.remove(stale)
+        return mesh
+
+    @staticmethod
+    def _is_cached(mesh):
+        """Whether mesh is the one the cache holds for its stamped key"""
+        return _MESH_CACHE.get(mesh.get("_keycap_key")) == mesh.name
+
+    @staticmethod
+    def release_mesh(mesh):
+        """Remove a keycap mesh nothing uses, unless the cache can reuse it"""
+        if mesh.users == 0 and not KeycapGenerator._is_cached(mesh):
+            bpy.data.meshes.remove(mesh)
+
+    @staticmethod
+    def clear_mesh_cache():
+        """Forget cached meshes - their names only hold for the current file"""
+        _MESH_CACHE.clear()
+
+    @staticmethod
+    def _build_mesh(
+        mesh, width, profile_type, profile_row, stem_type, stem_segments=32
+    ):
+        shell_verts, inner_top_z = KeycapGenerator._shell_vertices(
+            width, profile_type, profile_row
+        )
+        verts = shell_verts.copy()
+
+        faces = list(SHELL_FACES)
+
+        # Append the stem to the shell buffers so the whole keycap is
+        # uploaded at once - no separate stem object or boolean union
+        if stem_type == "CHERRY_MX":
+            # The stem runs up to the ceiling and is stitched into it, so
+            # the keycap stays one closed surface
+            stem_verts, stem_faces = KeycapGenerator._cherry_stem_geometry(
+                inner_top_z, stem_segments
+            )
+            offset = len(verts)
+            faces += [tuple(offset + i for i in face) for face in stem_faces]
+            verts = np.concatenate((verts, stem_verts))
+
+            # Split the ceiling into four n-gons around the stem top, each
+            # bounded by one ceiling edge, two spokes and a stem arc
+            top_ring = offset + len(stem_verts) // 2
+            step = stem_segments // 8
+            for k in range(4):
+                corner_a, eighth_a = CEILING_SPOKES[k]
+                corner_b, eighth_b = CEILING_SPOKES[(k + 1) % 4]
+                arc = [
+                    top_ring + (eighth_b * step - j) % stem_segments
+                    for j in range((eighth_b - eighth_a) % 8 * step + 1)
+                ]
+                faces.append(tuple(reversed([corner_a, corner_b] + arc)))
+        else:
+            faces.append(CEILING_FACE)
+
+        KeycapGenerator._fill_mesh(mesh, verts, faces)
+
+        # Bevel the 4 outer corner edges fully and the top rim at half weight
+        KeycapGenerator._set_bevel_weights(mesh, CORNER_EDGES, 1.0)
+        KeycapGenerator._set_bevel_weights(mesh, TOP_RIM_EDGES, 0.5)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _shell_vertices(width, profile_type, profile_row):
+        """Shell vertices of a keycap and the height of its inner ceiling
 
-        # Create edge tracking sets
-        top_rim_edges = []
-        vertical_edges = []
-        inner_vertical_edges = []
+        Cached per shape; the returned buffer is shared and read-only.
+        """
 
         # Cherry profile measurements (in mm, converted to Blender units)
         base_width = width * 18.0  # 1U = 18mm
@@ -52,231 +256,168 @@ class KeycapGenerator:
         wall_thickness = 0.91  # Wall thickness in mm
 
         # Profile-specific dimensions
-        if profile_type == "CHERRY":
-            top_width = base_width - 5.5
-            front_taper = 3.4  # mm pulled in on top face compared to base
-            row_heights = {1: 11.5, 2: 9.5, 3: 8.5, 4: 9.5}
-
-        elif profile_type == "OEM":
-            top_width = base_width - 3.0
-            front_taper = 3.0
-            row_heights = {1: 12.5, 2: 11.0, 3: 9.5, 4: 10.5}
-
-        elif profile_type == "SA":
-            top_width = base_width - 2.5
-            front_taper = 2.5
-            row_heights = {1: 14.89, 2: 13.49, 3: 12.925, 4: 13.49}
-
-        keycap_height = row_heights.get(profile_row, row_heights[3])
-
-        # Outer shell vertices
-        # Create base vertices (bottom outer)
-        base_outer = [
-            bm.verts.new((-base_width / 2, -base_height / 2, 0)),
-            bm.verts.new((base_width / 2, -base_height / 2, 0)),
-            bm.verts.new((base_width / 2, base_height / 2, 0)),
-            bm.verts.new((-base_width / 2, base_height / 2, 0)),
-        ]
+        profile = PROFILES[profile_type]
+        top_width = base_width - profile["top_delta"]
+        front_taper = profile["front_taper"]
+
+        # Fall back to the home row (R3) for out-of-range rows
+        row_heights = profile["row_heights"]
+        keycap_height = row_heights[profile_row - 1 if 1 <= profile_row <= 4 else 2]
 
         back_y = base_height / 2
         front_y = (base_height / 2) - front_taper
 
-        # Create top vertices (outer)
-        top_outer = [
-            bm.verts.new((-top_width / 2, -back_y, keycap_height)),
-            bm.verts.new((top_width / 2, -back_y, keycap_height)),
-            bm.verts.new((top_width / 2, front_y, keycap_height)),
-            bm.verts.new((-top_width / 2, front_y, keycap_height)),
-        ]
-
-        # Inner shell vertices (offset by wall thickness)
-        # Calculate inner dimensions
+        # Inner shell dimensions (offset by wall thickness)
         base_inner_width = base_width - (wall_thickness * 2)
         base_inner_height = base_height - (wall_thickness * 2)
         top_inner_width = top_width - (wall_thickness * 2)
         front_inner_taper = front_taper
         inner_top_z = keycap_height - wall_thickness
 
-        # Create base inner vertices (just above bottom)
-        base_inner = [
-            bm.verts.new((-base_inner_width / 2, -base_inner_height / 2, 0)),
-            bm.verts.new((base_inner_width / 2, -base_inner_height / 2, 0)),
-            bm.verts.new((base_inner_width / 2, base_inner_height / 2, 0)),
-            bm.verts.new((-base_inner_width / 2, base_inner_height / 2, 0)),
-        ]
-
         back_inner_y = base_inner_height / 2
         front_inner_y = (base_inner_height / 2) - front_inner_taper
 
-        # Create top inner vertices
-        top_inner = [
-            bm.verts.new((-top_inner_width / 2, -back_inner_y, inner_top_z)),
-            bm.verts.new((top_inner_width / 2, -back_inner_y, inner_top_z)),
-            bm.verts.new((top_inner_width / 2, front_inner_y, inner_top_z)),
-            bm.verts.new((-top_inner_width / 2, front_inner_y, inner_top_z)),
-        ]
-
-        # Create faces - Outer shell
-        # Top face (outer)
-        top_face = bm.faces.new(top_outer)
-
-        # Outer side faces
-        for i in range(4):
-            next_i = (i + 1) % 4
-            face = bm.faces.new(
-                [base_outer[i], base_outer[next_i], top_outer[next_i], top_outer[i]]
-            )
-
-        # Track only the 4 corner edges (not all vertical edges)
-        bevel_weight_layer = bm.edges.layers.float.get("bevel_weight_edge")
-        if bevel_weight_layer is None:
-            bevel_weight_layer = bm.edges.layers.float.new("bevel_weight_edge")
-
-        corner_edges = []
-
-        for i in range(4):
-            # Each corner has exactly one vertical edge connecting base_outer[i] to top_outer[i]
-            for edge in base_outer[i].link_edges:
-                v1, v2 = edge.verts
-                if (v1 == base_outer[i] and v2 == top_outer[i]) or (
-                    v2 == base_outer[i] and v1 == top_outer[i]
-                ):
-                    edge.select = True
-                    corner_edges.append(edge)
-                    edge[bevel_weight_layer] = 1.0
-                    break
-
-        # Create faces - Inner shell
-        # Top face (inner) - reversed to face inward
-        bm.faces.new(top_inner[::-1])
-
-        # Inner side faces
-        for i in range(4):
-            next_i = (i + 1) % 4
-            face = bm.faces.new(
-                [base_inner[i], top_inner[i], top_inner[next_i], base_inner[next_i]]
-            )
-
-            # Track inner vertical edges (corners)
-            for edge in face.edges:
-                v1, v2 = edge.verts
-                # Check if edge connects bottom to top (different z values)
-                if abs(v1.co.z - v2.co.z) > 0.001:
-                    if edge not in inner_vertical_edges:
-                        inner_vertical_edges.append(edge)
-                        edge.select = True
-
-        # Connect bottom edges (rim where outer meets inner)
-        for i in range(4):
-            next_i = (i + 1) % 4
-            # Bottom rim face
-            bm.faces.new(
-                [base_outer[i], base_inner[i], base_inner[next_i], base_outer[next_i]]
-            )
-
-        bm.normal_update()
-
-        # Track top rim edges
-        top_faces = [
-            f
-            for f in bm.faces
-            if abs(sum(v.co.z for v in f.verts) / len(f.verts) - keycap_height) < 0.001
-            and abs(f.normal.z) > 0.9
-        ]
-
-        rim_edges = []
-
-        if top_faces:
-            top_face = top_faces[0]
-            # any edge of the top face that is shared with a non-horizontal face -> rim
-            for e in top_face.edges:
-                for lf in e.link_faces:
-                    if lf is top_face:
-                        continue
-                    if abs(lf.normal.z) < 0.99:  # linked face isn't horizontal
-                        rim_edges.append(e)
-                        e[bevel_weight_layer] = 0.5
-                        break
-
-        # Create deform layer for vertex groups
-        deform_layer = bm.verts.layers.deform.verify()
-
-        # Write bmesh to mesh
-        bm.to_mesh(mesh)
-        bm.free()
+        # Each ring of 4 corners as (half width, back y, front y, z) in the
+        # vertex layout order: base outer, top outer, base inner, top inner
+        rings = np.array(
+            [
+                (base_width / 2, -base_height / 2, base_height / 2, 0),
+                (top_width / 2, -back_y, front_y, keycap_height),
+                (
+                    base_inner_width / 2,
+                    -base_inner_height / 2,
+                    base_inner_height / 2,
+                    0,
+                ),
+                (top_inner_width / 2, -back_inner_y, front_inner_y, inner_top_z),
+            ],
+            dtype=np.float32,
+        )
 
-        KeycapGenerator.add_bevel_modifiers(obj)
+        # Broadcast the corner pattern across all rings at once
+        verts = np.empty((4, 4, 3), dtype=np.float32)
+        verts[:, :, 0] = rings[:, 0:1] * CORNER_X_SIGNS
+        verts[:, :, 1] = np.where(CORNER_IS_FRONT, rings[:, 2:3], rings[:, 1:2])
+        verts[:, :, 2] = rings[:, 3:4]
+        verts = verts.reshape(-1, 3)
+        verts.flags.writeable = False
+        return verts, inner_top_z
 
-        # Add stem using boolean modifier (after mesh is created)
-        if stem_type == "CHERRY_MX":
-            KeycapGenerator._add_cherry_stem(obj, keycap_height)
+    @staticmethod
+    def _set_bevel_weights(mesh, edge_verts, weight):
+        """Write a bevel weight to the edges joining the given vertex pairs"""
+        weight_attr = mesh.attributes.get("bevel_weight_edge")
+        if weight_attr is None:
+            weight_attr = mesh.attributes.new("bevel_weight_edge", "FLOAT", "EDGE")
+
+        num_verts = len(mesh.vertices)
+        mesh_edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", mesh_edges)
+        mesh_edges = np.sort(mesh_edges.reshape(-1, 2), axis=1)
+        wanted = np.sort(np.array(edge_verts, dtype=np.int32), axis=1)
+
+        weights = np.empty(len(mesh.edges), dtype=np.float32)
+        weight_attr.data.foreach_get("value", weights)
+        mask = np.isin(
+            mesh_edges[:, 0] * num_verts + mesh_edges[:, 1],
+            wanted[:, 0] * num_verts + wanted[:, 1],
+        )
+        weights[mask] = weight
+        weight_attr.data.foreach_set("value", weights)
 
-        return obj
+    @staticmethod
+    def _fill_mesh(mesh, verts, faces):
+        """Upload vertices and polygons into an empty mesh in bulk"""
+        loop_total = np.array([len(face) for face in faces], dtype=np.int32)
+        loop_start = np.zeros(len(faces), dtype=np.int32)
+        np.cumsum(loop_total[:-1], out=loop_start[1:])
+        loops = np.array([i for face in faces for i in face], dtype=np.int32)
+
+        mesh.vertices.add(len(verts))
+        mesh.attributes["position"].data.foreach_set("vector", verts.ravel())
+        mesh.loops.add(len(loops))
+        mesh.loops.foreach_set("vertex_index", loops)
+        mesh.polygons.add(len(faces))
+        mesh.polygons.foreach_set("loop_start", loop_start)
+        mesh.update(calc_edges=True)
 
     @staticmethod
-    def _add_cherry_stem(keycap_obj, keycap_height):
+    @functools.lru_cache(maxsize=32)
+    def _cherry_stem_geometry(stem_height, segments=32):
+        """Vertices and faces of a Cherry MX stem: a cylinder with a + slot
+
+        The top is left open around the slot for the keycap ceiling to join
+        onto; segments must be a multiple of 8. Cached per height and resolution;
+        the returned buffers are shared and read-only.
+        """
 
         # Cherry MX stem dimensions (in mm)
         stem_outer_radius = 5.6 / 2  # Outer cylinder diameter ~5.5mm
-        stem_height = keycap_height - 0.5  # Height of stem extending down
         cross_length = 4.15  # Cross arm length
         cross_width = 1.29  # Cross arm width
 
-        # Create stem cylinder
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=64,
-            radius=stem_outer_radius,
-            depth=stem_height,
-            location=(0, 0, stem_height / 2),
+        # Outer cylinder outline
+        theta = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False)
+        ring = stem_outer_radius * np.column_stack((np.cos(theta), np.sin(theta)))
+
+        # Cross slot outline, counter-clockwise starting on the +X arm
+        a = cross_length / 2
+        b = cross_width / 2
+        cross = np.array(
+            [
+                (a, -b),
+                (a, b),
+                (b, b),
+                (b, a),
+                (-b, a),
+                (-b, b),
+                (-a, b),
+                (-a, -b),
+                (-b, -b),
+                (-b, -a),
+                (b, -a),
+                (b, -b),
+            ]
         )
-        stem_cylinder = bpy.context.active_object
-        stem_cylinder.name = "Stem_Cylinder"
-
-        # Create vertical bar of cross
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, stem_height / 2))
-        v_cross = bpy.context.active_object
-        v_cross.name = "Cross_Vertical"
-        v_cross.scale = (cross_width, cross_length, stem_height + 0.2)
-
-        # Create horizontal bar of cross
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, stem_height / 2))
-        h_cross = bpy.context.active_object
-        h_cross.name = "Cross_Horizontal"
-        h_cross.scale = (cross_length, cross_width, stem_height + 0.2)
-
-        # Apply boolean difference to cut vertical cross from cylinder
-        bool_mod_v = stem_cylinder.modifiers.new(name="Boolean_V", type="BOOLEAN")
-        bool_mod_v.operation = "DIFFERENCE"
-        bool_mod_v.object = v_cross
-        bool_mod_v.solver = "FLOAT"
-
-        # Apply boolean difference to cut horizontal cross from cylinder
-        bool_mod_h = stem_cylinder.modifiers.new(name="Boolean_H", type="BOOLEAN")
-        bool_mod_h.operation = "DIFFERENCE"
-        bool_mod_h.object = h_cross
-        bool_mod_h.solver = "FLOAT"
-
-        # Apply boolean modifiers
-        bpy.context.view_layer.objects.active = stem_cylinder
-        bpy.ops.object.modifier_apply(modifier="Boolean_V")
-        bpy.ops.object.modifier_apply(modifier="Boolean_H")
-
-        # Delete cross objects
-        bpy.data.objects.remove(v_cross, do_unlink=True)
-        bpy.data.objects.remove(h_cross, do_unlink=True)
-
-        # Add boolean union modifier to keycap
-        union_mod = keycap_obj.modifiers.new(name="Boolean_Stem_Union", type="BOOLEAN")
-        union_mod.operation = "UNION"
-        union_mod.object = stem_cylinder
-        union_mod.solver = "FLOAT"
-
-        # Apply the union modifier to merge stem into keycap
-        bpy.context.view_layer.objects.active = keycap_obj
-        bpy.ops.object.modifier_apply(modifier="Boolean_Stem_Union")
-
-        # Delete the stem object now that it's merged
-        bpy.data.objects.remove(stem_cylinder, do_unlink=True)
-
-        keycap_obj.select_set(True)
-        bpy.context.view_layer.objects.active = keycap_obj
+
+        # Bottom outline (0..n-1) followed by the same outline at the top
+        outline = np.vstack((ring, cross))
+        n = len(outline)
+        verts = np.zeros((2 * n, 3), dtype=np.float32)
+        verts[:n, :2] = outline
+        verts[n:, :2] = outline
+        verts[n:, 2] = stem_height
+
+        faces = []
+
+        # Outer cylinder wall
+        for i in range(segments):
+            next_i = (i + 1) % segments
+            faces.append((i, next_i, n + next_i, n + i))
+
+        # Cross slot walls - facing into the slot
+        for i in range(12):
+            next_i = (i + 1) % 12
+            faces.append(
+                (
+                    segments + i,
+                    n + segments + i,
+                    n + segments + next_i,
+                    segments + next_i,
+                )
+            )
+
+        # Bottom cap: the ring between cylinder and slot is split into four
+        # n-gons by spokes from the inner cross corners out to the cylinder
+        # at 45/135/225/315 degrees (segments must be a multiple of 8)
+        step = segments // 8
+        for q in range(4):
+            arc = [(step * (2 * q + 1) + k) % segments for k in range(2 * step + 1)]
+            slot = [segments + (2 + 3 * q + k) % 12 for k in range(3, -1, -1)]
+            faces.append(tuple(reversed(arc + slot)))
+
+        # Close the top of the slot - part of the ceiling, facing down
+        faces.append(tuple(n + segments + i for i in range(11, -1, -1)))
+
+        verts.flags.writeable = False
+        return verts, tuple(faces)
@@ -8,6 +8,20 @@ import subprocess
 from .geometry import KeycapGenerator
 
 
+def setup_millimeter_units(context):
+    """Switch the scene to metric millimetres and match the viewport grid"""
+    context.scene.unit_settings.system = "METRIC"
+    context.scene.unit_settings.scale_length = 0.001  # 1 BU = 1mm
+    context.scene.unit_settings.length_unit = "MILLIMETERS"
+
+    # The panel's own viewport, or else the first 3D viewport on screen
+    area = context.area
+    if area is None or area.type != "VIEW_3D":
+        area = next((a for a in context.screen.areas if a.type == "VIEW_3D"), None)
+    if area is not None:
+        area.spaces.active.overlay.grid_scale = 0.001  # Each grid square = 1 mm
+
+
 class KEYCAP_OT_generate(bpy.types.Operator):
     """Generate a keycap with specified parameters"""
 
@@ -16,15 +30,10 @@ class KEYCAP_OT_generate(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
-        # Set unit system to metric with millimeter scale
-        context.scene.unit_settings.system = "METRIC"
-        context.scene.unit_settings.scale_length = 0.001  # 1 BU = 1mm
-        context.scene.unit_settings.length_unit = "MILLIMETERS"
-
-        for area in bpy.context.screen.areas:
-            if area.type == "VIEW_3D":
-                space = area.spaces.active
-                space.overlay.grid_scale = 0.001  # Each grid square = 1 mm
+        # Millimetre units only need setting up once per scene
+        if not context.scene.get("_keycap_units_inited"):
+            setup_millimeter_units(context)
+            context.scene["_keycap_units_inited"] = True
 
         props = context.scene.keycap_props
 
@@ -33,7 +42,9 @@ class KEYCAP_OT_generate(bpy.types.Operator):
             profile_type=props.profile_type,
             profile_row=int(props.profile_row),
             bevel_vertical=props.bevel_vertical,
+            bevel_segments=props.bevel_segments,
             stem_type=props.stem_type,
+            stem_segments=int(props.stem_resolution),
         )
 
         self.report({"INFO"}, f"Generated {props.width}U keycap (R{props.profile_row})")
@@ -54,20 +65,41 @@ class KEYCAP_OT_bake(bpy.types.Operator):
             self.report({"ERROR"}, "No object selected")
             return {"CANCELLED"}
 
+        if obj.type != "MESH":
+            self.report({"ERROR"}, f"Cannot bake {obj.type.lower()} object {obj.name}")
+            return {"CANCELLED"}
+
         if not obj.modifiers:
             self.report({"WARNING"}, "No modifiers to apply")
             return {"CANCELLED"}
 
-        # Apply all modifiers
+        # Preview bevels are kept coarse; bake at full quality
+        bevel_mod = obj.modifiers.get("Bevel_Vert_Mod")
+        if bevel_mod is not None:
+            preview_segments = bevel_mod.segments
+            bevel_mod.segments = max(preview_segments, 8)
         modifier_count = len(obj.modifiers)
-        bpy.context.view_layer.objects.active = obj
 
-        for mod in list(obj.modifiers):
-            try:
-                bpy.ops.object.modifier_apply(modifier=mod.name)
-            except Exception as e:
-                self.report({"ERROR"}, f"Failed to apply modifier {mod.name}: {str(e)}")
-                return {"CANCELLED"}
+        # Evaluate the whole modifier stack once into a new mesh, rather
+        # than applying the modifiers one by one
+        old_mesh = obj.data
+        baked_mesh = None
+        try:
+            depsgraph = context.evaluated_depsgraph_get()
+            baked_mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+            baked_mesh.pop("_keycap_key", None)  # not a cached keycap any more
+            obj.data = baked_mesh
+        except Exception as e:
+            if baked_mesh is not None:
+                bpy.data.meshes.remove(baked_mesh)
+            if bevel_mod is not None:
+                bevel_mod.segments = preview_segments
+            self.report({"ERROR"}, f"Failed to apply modifiers: {str(e)}")
+            return {"CANCELLED"}
+
+        obj.modifiers.clear()
+        # A shared keycap mesh stays cached for other keycaps
+        KeycapGenerator.release_mesh(old_mesh)
 
         self.report({"INFO"}, f"Applied {modifier_count} modifier(s)")
         return {"FINISHED"}
@@ -95,7 +127,23 @@ class KEYCAP_OT_export(bpy.types.Operator):
         export_path = os.path.join(export_dir, filename)
 
         if ex.file_format == "STL":
-            bpy.ops.wm.stl_export(filepath=export_path, check_existing=True)
+            # Only export the selection, which always includes the keycap
+            obj.select_set(True)
+            # The exporter applies modifiers - use full quality bevels for
+            # the file and put the preview setting back afterwards
+            bevel_mod = obj.modifiers.get("Bevel_Vert_Mod")
+            if bevel_mod is not None:
+                preview_segments = bevel_mod.segments
+                bevel_mod.segments = max(preview_segments, 8)
+            try:
+                bpy.ops.wm.stl_export(
+                    filepath=export_path,
+                    check_existing=True,
+                    export_selected_objects=True,
+                )
+            finally:
+                if bevel_mod is not None:
+                    bevel_mod.segments = preview_segments
         # elif ex.file_format == "OBJ":
         #     bpy.ops.export_scene.obj(filepath=export_path, use_selection=True)
         # elif ex.file_format == "GLB":
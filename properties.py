@@ -5,38 +5,70 @@ Property definitions and update callbacks
 import bpy
 from .geometry import KeycapGenerator
 
+# Seconds without further property changes before they are applied, so a
+# burst of updates (e.g. dragging a slider or scrolling through widths) is
+# applied once at the end
+REGEN_DELAY = 0.1
+
+# Latest requested state, captured when a property changes and applied by
+# flush_pending_updates. Later changes simply overwrite earlier ones.
+_pending_keycap = None  # keyword arguments for KeycapGenerator.update_keycap
+_pending_bevels = None  # (bevel width, bevel segments)
+
+
+def flush_pending_updates():
+    """Timer callback that applies the most recent keycap and bevel changes"""
+    global _pending_keycap, _pending_bevels
+    keycap_params, bevel_params = _pending_keycap, _pending_bevels
+    _pending_keycap = _pending_bevels = None
 
-def update_keycap(self, context):
-    """Regenerate keycap when properties change"""
     # Find existing keycap
     keycap = bpy.data.objects.get("Keycap")
-    if keycap:
-        # Store other props
-        props = context.scene.keycap_props
-        # Delete old keycap
-        bpy.data.objects.remove(keycap, do_unlink=True)
-        # Generate new one
-        KeycapGenerator.create_keycap(
-            width=float(props.width),
-            profile_type=props.profile_type,
-            profile_row=int(props.profile_row),
-            bevel_vertical=props.bevel_vertical,
-            stem_type=props.stem_type,
-        )
+    if keycap_params is not None and keycap is not None:
+        # Swap the mesh on the existing object - its modifiers, selection
+        # and transform are left untouched
+        KeycapGenerator.update_keycap(keycap, **keycap_params)
 
+    if bevel_params is not None and keycap is not None:
+        bevel_vertical, bevel_segments = bevel_params
+        mod = keycap.modifiers.get("Bevel_Vert_Mod")
+        if mod is not None:
+            mod.width = bevel_vertical
+            mod.segments = bevel_segments
+
+    return None  # run once
 
-def update_bevels(self, context):
-    """Update bevel modifiers when bevel properties change"""
-    obj = context.active_object
-    if obj is None:
-        return
 
+def _schedule_flush():
+    # Restart the timer on every change so it only fires once changes stop
+    if bpy.app.timers.is_registered(flush_pending_updates):
+        bpy.app.timers.unregister(flush_pending_updates)
+    bpy.app.timers.register(flush_pending_updates, first_interval=REGEN_DELAY)
+
+
+def update_keycap(self, context):
+    """Schedule a keycap regeneration when properties change"""
+    global _pending_keycap
     props = context.scene.keycap_props
+    _pending_keycap = dict(
+        width=float(props.width),
+        profile_type=props.profile_type,
+        profile_row=int(props.profile_row),
+        bevel_vertical=props.bevel_vertical,
+        bevel_segments=props.bevel_segments,
+        stem_type=props.stem_type,
+        stem_segments=int(props.stem_resolution),
+    )
+    _schedule_flush()
 
-    for mod in obj.modifiers:
-        if mod.type == "BEVEL":
-            if mod.name == "Bevel_Vert_Mod":
-                mod.width = props.bevel_vertical
+
+def update_bevels(self, context):
+    """Schedule a bevel modifier update when bevel properties change"""
+    global _pending_bevels
+    props = context.scene.keycap_props
+    # Applied to the keycap by name, so edits work whatever is selected
+    _pending_bevels = (props.bevel_vertical, props.bevel_segments)
+    _schedule_flush()
 
 
 class KeycapProperties(bpy.types.PropertyGroup):
@@ -96,6 +128,15 @@ class KeycapProperties(bpy.types.PropertyGroup):
         update=update_bevels,
     )
 
+    bevel_segments: bpy.props.IntProperty(
+        name="Bevel Segments",
+        description="Number of segments in the corner bevels",
+        default=4,
+        min=1,
+        max=16,
+        update=update_bevels,
+    )
+
     stem_type: bpy.props.EnumProperty(
         name="Stem Type",
         description="Switch stem type",
@@ -107,6 +148,18 @@ class KeycapProperties(bpy.types.PropertyGroup):
         update=update_keycap,
     )
 
+    stem_resolution: bpy.props.EnumProperty(
+        name="Stem Resolution",
+        description="Number of segments around the stem cylinder",
+        items=[
+            ("24", "Low", "24 segments - plenty for FDM printing"),
+            ("32", "Medium", "32 segments"),
+            ("64", "High", "64 segments for resin printing"),
+        ],
+        default="32",
+        update=update_keycap,
+    )
+
 
 class KeycapExportProperties(bpy.types.PropertyGroup):
     """Property group for export settings"""
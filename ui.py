@@ -35,10 +35,15 @@ class KEYCAP_PT_main(bpy.types.Panel):
         split.label(text="Stem Type: ")
         split.prop(props, "stem_type", text="")
 
+        split = box.split(factor=0.5)
+        split.label(text="Stem Resolution: ")
+        split.prop(props, "stem_resolution", text="")
+
         # Bevel settings
         bevel_box = layout.box()
         bevel_box.label(text="Bevels:", icon="MOD_BEVEL")
         bevel_box.prop(props, "bevel_vertical")
+        bevel_box.prop(props, "bevel_segments")
 
         # Generate button
         layout.separator()